@@ -2,22 +2,24 @@
 Flask Web Application for Steganography Analysis
 """
 
+import collections
+import hashlib
 import os
+import threading
+import time
 import uuid
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 # Suppress FFmpeg warnings from pydub
 warnings.filterwarnings('ignore', message='.*ffmpeg.*', category=RuntimeWarning)
 warnings.filterwarnings('ignore', message='.*avconv.*', category=RuntimeWarning)
 
+# Analyzer modules (and transitively numpy, PIL, cv2, pydub, reportlab)
+# are imported lazily inside the routes that need them, keeping worker
+# startup fast and per-worker memory small
 from flask import Flask, render_template, request, jsonify, send_file, session
 from werkzeug.utils import secure_filename
-from steganography_analyzer.image_analyzer import ImageSteganographyAnalyzer
-from steganography_analyzer.audio_analyzer import AudioSteganographyAnalyzer
-from steganography_analyzer.video_analyzer import VideoSteganographyAnalyzer
-from steganography_analyzer.report_generator import ReportGenerator
-import numpy as np
-from PIL import Image
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
@@ -36,6 +38,82 @@ ALLOWED_EXTENSIONS = {
     'video': {'mp4', 'avi', 'mov', 'mkv', 'flv'}
 }
 
+# Server-side analysis history: an append-only deque per session id,
+# guarded by a lock for the threaded workers. Keeping the full analysis
+# dicts out of the signed-cookie session avoids re-serializing and
+# resending the whole history with every response.
+_analyses = {}
+_analyses_lock = threading.Lock()
+
+def get_session_analyses():
+    """Get the server-side analysis log for the current session"""
+    sid = session.get('sid')
+    if sid is None:
+        sid = str(uuid.uuid4())
+        session['sid'] = sid
+    with _analyses_lock:
+        return _analyses.setdefault(sid, collections.deque())
+
+# Completed analyses keyed by SHA-256 of the uploaded bytes, so
+# re-uploading the same file skips the analyzers entirely. Bounded LRU:
+# analyses carry extracted payload strings, so an unbounded cache would
+# grow with every unique upload.
+_analysis_cache = collections.OrderedDict()
+_analysis_cache_lock = threading.Lock()
+ANALYSIS_CACHE_MAX = 32
+
+def _cache_analysis(digest, analysis):
+    """Store an analysis in the bounded cache, evicting the oldest entry"""
+    with _analysis_cache_lock:
+        _analysis_cache[digest] = dict(analysis)
+        _analysis_cache.move_to_end(digest)
+        while len(_analysis_cache) > ANALYSIS_CACHE_MAX:
+            _analysis_cache.popitem(last=False)
+
+def _cached_analysis(digest):
+    """Get a copy of a cached analysis, refreshing its LRU position"""
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(digest)
+        if cached is None:
+            return None
+        _analysis_cache.move_to_end(digest)
+        return dict(cached)
+
+# Background analysis tasks: task_id -> {'future': Future, metadata...},
+# guarded by a lock for the threaded workers. Tasks whose client never
+# polls to completion are dropped after TASK_TTL seconds.
+_tasks = {}
+_tasks_lock = threading.Lock()
+TASK_TTL = 3600
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Lazily create the shared analysis process pool"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _executor
+
+def run_analysis(file_type, filepath):
+    """Run the appropriate analyzer for a file (executes in a worker process)"""
+    from steganography_analyzer.image_analyzer import ImageSteganographyAnalyzer
+    from steganography_analyzer.audio_analyzer import AudioSteganographyAnalyzer
+    from steganography_analyzer.video_analyzer import VideoSteganographyAnalyzer
+
+    if file_type == 'image':
+        analyzer = ImageSteganographyAnalyzer(filepath)
+        return analyzer.analyze()
+    elif file_type == 'audio':
+        analyzer = AudioSteganographyAnalyzer(filepath)
+        return analyzer.analyze()
+    elif file_type == 'video':
+        analyzer = VideoSteganographyAnalyzer(filepath)
+        return analyzer.analyze(num_frames=10)
+    raise ValueError(f"Unknown file type: {file_type}")
+
 def allowed_file(filename, file_type='all'):
     """Check if file extension is allowed"""
     if '.' not in filename:
@@ -56,35 +134,37 @@ def get_file_type(filename):
             return file_type
     return None
 
+def message_to_bits(message):
+    """Convert a message to a bit array ending with the 16-bit marker (0xFF 0xFE)"""
+    import numpy as np
+    return np.unpackbits(np.frombuffer(message.encode('utf-8') + b'\xff\xfe', dtype=np.uint8))
+
 def create_sample_image_with_steganography(output_path, message="Hello, this is hidden data!"):
     """Create a sample image with LSB steganography"""
+    import numpy as np
+    from PIL import Image
+    from steganography_analyzer._kernels import embed_lsb
+
     width, height = 400, 300
-    img = Image.new('RGB', (width, height), color='white')
-    pixels = np.array(img)
-    
-    message_binary = ''.join(format(ord(c), '08b') for c in message)
-    message_binary += '1111111111111110'  # End marker
-    
-    bit_index = 0
-    for i in range(height):
-        for j in range(width):
-            for channel in range(3):
-                if bit_index < len(message_binary):
-                    pixels[i, j, channel] = (pixels[i, j, channel] & 0xFE) | int(message_binary[bit_index])
-                    bit_index += 1
-                else:
-                    break
-            if bit_index >= len(message_binary):
-                break
-        if bit_index >= len(message_binary):
-            break
-    
-    result_img = Image.fromarray(pixels)
+    # Build the pixel buffer directly; Image.new + np.array(img) would
+    # allocate and copy a second buffer
+    pixels = np.full((height, width, 3), 255, dtype=np.uint8)
+
+    bits = message_to_bits(message)
+
+    # Embed in LSBs with a single fused pass (C-order matches the
+    # row/column/channel traversal order)
+    embed_lsb(pixels.reshape(-1), bits)
+
+    result_img = Image.fromarray(pixels, mode='RGB')
     result_img.save(output_path)
     return output_path
 
 def create_sample_audio_with_steganography(output_path, message="Secret audio message"):
     """Create a sample audio file with LSB steganography"""
+    import numpy as np
+    from steganography_analyzer._kernels import embed_lsb
+
     try:
         # Suppress FFmpeg warnings during import and usage
         with warnings.catch_warnings():
@@ -96,21 +176,15 @@ def create_sample_audio_with_steganography(output_path, message="Secret audio me
         sample_rate = 44100
         frequency = 440
         
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        audio_data = np.sin(2 * np.pi * frequency * t)
-        audio_data = (audio_data * 32767).astype(np.int16)
-        
-        message_binary = ''.join(format(ord(c), '08b') for c in message)
-        message_binary += '1111111111111110'
-        
-        bit_index = 0
-        for i in range(len(audio_data)):
-            if bit_index < len(message_binary):
-                audio_data[i] = (audio_data[i] & 0xFFFE) | int(message_binary[bit_index])
-                bit_index += 1
-            else:
-                break
+        # Generate the tone in float32 with an in-place sin (no float64
+        # linspace intermediate)
+        n = int(sample_rate * duration)
+        phase = (2 * np.pi * frequency / sample_rate) * np.arange(n, dtype=np.float32)
+        audio_data = (np.sin(phase, out=phase) * 32767).astype(np.int16)
         
+        bits = message_to_bits(message)
+        embed_lsb(audio_data, bits)
+
         with warnings.catch_warnings():
             warnings.filterwarnings('ignore', message='.*ffmpeg.*', category=RuntimeWarning)
             warnings.filterwarnings('ignore', message='.*avconv.*', category=RuntimeWarning)
@@ -147,50 +221,113 @@ def upload_file():
     filename = secure_filename(file.filename)
     unique_filename = f"{uuid.uuid4()}_{filename}"
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-    file.save(filepath)
+    # Stream to disk with a 1 MiB buffer; file.save() copies in much
+    # smaller chunks, which is slow for the 100 MB uploads we allow.
+    # Hash the bytes as they pass through (hashlib dispatches to the
+    # hardware SHA extensions, so this is cheap next to the analysis).
+    hasher = hashlib.sha256()
+    with open(filepath, 'wb') as out:
+        while True:
+            chunk = file.stream.read(1024 * 1024)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            out.write(chunk)
+    digest = hasher.hexdigest()
     
     try:
-        # Determine file type and analyze
+        # Determine file type and queue analysis off the request thread
         file_type = get_file_type(filename)
-        
-        if file_type == 'image':
-            analyzer = ImageSteganographyAnalyzer(filepath)
-            analysis = analyzer.analyze()
-        elif file_type == 'audio':
-            analyzer = AudioSteganographyAnalyzer(filepath)
-            analysis = analyzer.analyze()
-        elif file_type == 'video':
-            analyzer = VideoSteganographyAnalyzer(filepath)
-            analysis = analyzer.analyze(num_frames=10)
-        else:
+        if file_type is None:
             return jsonify({'error': 'Unknown file type'}), 400
-        
-        # Store analysis in session
-        if 'analyses' not in session:
-            session['analyses'] = []
-        
-        analysis['original_filename'] = filename
-        analysis['unique_filename'] = unique_filename
-        session['analyses'].append(analysis)
-        session.modified = True
-        
+
+        task_id = str(uuid.uuid4())
+        task = {
+            'original_filename': filename,
+            'unique_filename': unique_filename,
+            'digest': digest,
+            'created': time.monotonic()
+        }
+
+        # Re-uploads of identical content reuse the cached analysis
+        cached = _cached_analysis(digest)
+        if cached is not None:
+            task['analysis'] = cached
+        else:
+            task['future'] = get_executor().submit(run_analysis, file_type, filepath)
+        with _tasks_lock:
+            # Drop abandoned tasks (clients that never polled to completion)
+            cutoff = time.monotonic() - TASK_TTL
+            for stale_id in [tid for tid, t in _tasks.items() if t['created'] < cutoff]:
+                del _tasks[stale_id]
+            _tasks[task_id] = task
+
         return jsonify({
             'success': True,
-            'analysis': analysis,
-            'message': 'File analyzed successfully'
-        })
-    
+            'task_id': task_id,
+            'message': 'Analysis started'
+        }), 202
+
     except Exception as e:
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
+@app.route('/status/<task_id>')
+def task_status(task_id):
+    """Poll a background analysis task"""
+    with _tasks_lock:
+        task = _tasks.get(task_id)
+    if task is None:
+        return jsonify({'error': 'Unknown task'}), 404
+
+    future = task.get('future')
+    if future is not None:
+        if not future.done():
+            return jsonify({'status': 'pending'})
+
+        # pop rather than del: a concurrent poll of the same finished
+        # task may already have removed it
+        with _tasks_lock:
+            _tasks.pop(task_id, None)
+        error = future.exception()
+        if error is not None:
+            return jsonify({'status': 'error', 'error': f'Analysis failed: {str(error)}'}), 500
+
+        analysis = future.result()
+        _cache_analysis(task['digest'], analysis)
+    else:
+        # Served from the content-hash cache
+        with _tasks_lock:
+            _tasks.pop(task_id, None)
+        analysis = task['analysis']
+
+    analysis['original_filename'] = task['original_filename']
+    analysis['unique_filename'] = task['unique_filename']
+
+    # Store analysis server-side; drop bulky binary strings from the
+    # stored copy (they can be regenerated on demand)
+    stored = dict(analysis)
+    stored['extraction'] = {
+        method: {k: v for k, v in result.items() if k != 'binary_data'}
+        for method, result in analysis.get('extraction', {}).items()
+    }
+    get_session_analyses().append(stored)
+
+    return jsonify({
+        'status': 'done',
+        'analysis': analysis,
+        'message': 'File analyzed successfully'
+    })
+
 @app.route('/generate_report', methods=['POST'])
 def generate_report():
     """Generate PDF report from analyses"""
     try:
-        analyses = session.get('analyses', [])
+        analyses = get_session_analyses()
         if not analyses:
             return jsonify({'error': 'No analyses to report'}), 400
         
+        from steganography_analyzer.report_generator import ReportGenerator
+
         # Generate report
         report_filename = f"steganography_report_{uuid.uuid4()}.pdf"
         report_path = os.path.join(app.config['REPORTS_FOLDER'], report_filename)
@@ -250,10 +387,13 @@ def create_samples():
 @app.route('/clear_session', methods=['POST'])
 def clear_session():
     """Clear analysis session"""
-    session['analyses'] = []
-    session.modified = True
+    sid = session.get('sid')
+    if sid is not None:
+        with _analyses_lock:
+            _analyses.pop(sid, None)
     return jsonify({'success': True, 'message': 'Session cleared'})
 
 if __name__ == '__main__':
+    # Development server only; deploy via wsgi.py with gunicorn in production
     app.run(debug=True, host='0.0.0.0', port=5000)
 
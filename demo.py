@@ -6,12 +6,24 @@ Main application for detecting and extracting hidden data from media files
 import os
 import sys
 import argparse
-from steganography_analyzer.image_analyzer import ImageSteganographyAnalyzer
-from steganography_analyzer.audio_analyzer import AudioSteganographyAnalyzer
-from steganography_analyzer.video_analyzer import VideoSteganographyAnalyzer
-from steganography_analyzer.report_generator import ReportGenerator
-import numpy as np
-from PIL import Image
+
+# Analyzer modules (and transitively numpy, PIL, cv2, pydub, reportlab)
+# are imported lazily inside the functions that need them, so e.g.
+# --help and argument errors don't pay their startup cost
+
+
+def message_to_bits(message):
+    """
+    Convert a message to a bit array for LSB embedding
+
+    Args:
+        message: Message string to convert
+
+    Returns:
+        np.ndarray: Bit array ending with the 16-bit end marker (0xFF 0xFE)
+    """
+    import numpy as np
+    return np.unpackbits(np.frombuffer(message.encode('utf-8') + b'\xff\xfe', dtype=np.uint8))
 
 
 def create_sample_image_with_steganography(output_path, message="Hello, this is hidden data!"):
@@ -22,33 +34,24 @@ def create_sample_image_with_steganography(output_path, message="Hello, this is
         output_path: Path to save the sample image
         message: Message to hide in the image
     """
-    # Create a simple image
+    import numpy as np
+    from PIL import Image
+    from steganography_analyzer._kernels import embed_lsb
+
+    # Create a simple white image; build the pixel buffer directly so
+    # there's no Image.new + np.array(img) copy round-trip
     width, height = 400, 300
-    img = Image.new('RGB', (width, height), color='white')
-    pixels = np.array(img)
-    
-    # Convert message to binary
-    message_binary = ''.join(format(ord(c), '08b') for c in message)
-    message_binary += '1111111111111110'  # End marker (16 bits)
-    
-    # Embed message in LSB
-    bit_index = 0
-    for i in range(height):
-        for j in range(width):
-            for channel in range(3):  # RGB channels
-                if bit_index < len(message_binary):
-                    # Modify LSB
-                    pixels[i, j, channel] = (pixels[i, j, channel] & 0xFE) | int(message_binary[bit_index])
-                    bit_index += 1
-                else:
-                    break
-            if bit_index >= len(message_binary):
-                break
-        if bit_index >= len(message_binary):
-            break
+    pixels = np.full((height, width, 3), 255, dtype=np.uint8)
     
+    # Convert message to bits (includes the end marker)
+    bits = message_to_bits(message)
+
+    # Embed message in LSBs with a single fused pass (C-order matches
+    # the row/column/channel traversal order)
+    embed_lsb(pixels.reshape(-1), bits)
+
     # Save image
-    result_img = Image.fromarray(pixels)
+    result_img = Image.fromarray(pixels, mode='RGB')
     result_img.save(output_path)
     print(f"Created sample image with steganography: {output_path}")
     print(f"Hidden message: {message}")
@@ -65,31 +68,25 @@ def create_sample_audio_with_steganography(output_path, message="Secret audio me
     try:
         from pydub import AudioSegment
         import numpy as np
-        
+        from steganography_analyzer._kernels import embed_lsb
+
         # Create a simple sine wave audio
         duration = 2  # seconds
         sample_rate = 44100
         frequency = 440  # A4 note
         
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        audio_data = np.sin(2 * np.pi * frequency * t)
-        
-        # Normalize and convert to int16
-        audio_data = (audio_data * 32767).astype(np.int16)
-        
-        # Convert message to binary
-        message_binary = ''.join(format(ord(c), '08b') for c in message)
-        message_binary += '1111111111111110'  # End marker
-        
-        # Embed message in LSB
-        bit_index = 0
-        for i in range(len(audio_data)):
-            if bit_index < len(message_binary):
-                audio_data[i] = (audio_data[i] & 0xFFFE) | int(message_binary[bit_index])
-                bit_index += 1
-            else:
-                break
+        # Generate the tone in float32 with an in-place sin (avoids the
+        # float64 linspace intermediate), then normalize to int16
+        n = int(sample_rate * duration)
+        phase = (2 * np.pi * frequency / sample_rate) * np.arange(n, dtype=np.float32)
+        audio_data = (np.sin(phase, out=phase) * 32767).astype(np.int16)
         
+        # Convert message to bits (includes the end marker)
+        bits = message_to_bits(message)
+
+        # Embed message in LSBs with a single fused pass
+        embed_lsb(audio_data, bits)
+
         # Convert to AudioSegment
         audio_segment = AudioSegment(
             audio_data.tobytes(),
@@ -138,12 +135,15 @@ def analyze_file(file_path, file_type=None):
     
     try:
         if file_type == 'image':
+            from steganography_analyzer.image_analyzer import ImageSteganographyAnalyzer
             analyzer = ImageSteganographyAnalyzer(file_path)
             analysis = analyzer.analyze()
         elif file_type == 'audio':
+            from steganography_analyzer.audio_analyzer import AudioSteganographyAnalyzer
             analyzer = AudioSteganographyAnalyzer(file_path)
             analysis = analyzer.analyze()
         elif file_type == 'video':
+            from steganography_analyzer.video_analyzer import VideoSteganographyAnalyzer
             analyzer = VideoSteganographyAnalyzer(file_path)
             analysis = analyzer.analyze(num_frames=10)
         else:
@@ -279,6 +279,7 @@ def main():
     if args.report and analyses:
         print(f"\nGenerating PDF report: {args.report}")
         try:
+            from steganography_analyzer.report_generator import ReportGenerator
             generator = ReportGenerator(args.report)
             generator.generate(analyses)
             print(f"Report generated successfully: {args.report}")
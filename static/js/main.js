@@ -51,7 +51,9 @@ async function handleFile(file) {
         const data = await response.json();
 
         if (response.ok && data.success) {
-            displayResults(data.analysis);
+            // Analysis runs in the background; poll until it finishes
+            const analysis = await pollAnalysis(data.task_id);
+            displayResults(analysis);
             reportSection.style.display = 'block';
         } else {
             resultsContainer.innerHTML = `<div class="error-message">Error: ${data.error || 'Analysis failed'}</div>`;
@@ -61,6 +63,22 @@ async function handleFile(file) {
     }
 }
 
+// Poll a background analysis task until it completes
+async function pollAnalysis(taskId) {
+    while (true) {
+        const response = await fetch(`/status/${taskId}`);
+        const data = await response.json();
+
+        if (!response.ok || data.status === 'error') {
+            throw new Error(data.error || 'Analysis failed');
+        }
+        if (data.status === 'done') {
+            return data.analysis;
+        }
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+}
+
 // Display analysis results
 function displayResults(analysis) {
     const fileType = analysis.image_info ? 'image' : 
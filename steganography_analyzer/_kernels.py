@@ -0,0 +1,68 @@
+"""
+Numba-accelerated kernels for LSB analysis
+Fuses the bit masking, counting and embedding loops into single passes.
+Falls back to NumPy implementations when numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _lsb_stats_py(samples):
+    """Count set LSBs in a 1-D sample array (NumPy fallback)"""
+    ones = int(np.count_nonzero(samples & 1))
+    return ones, int(samples.size)
+
+
+def _extract_lsb_bytes_py(arr, num_bytes):
+    """Pack the LSBs of arr into num_bytes bytes (NumPy fallback)"""
+    bits = (arr[:num_bytes * 8] & 1).astype(np.uint8)
+    return np.packbits(bits)
+
+
+def _embed_lsb_py(flat, bits):
+    """Set the LSBs of flat[:len(bits)] to bits (NumPy fallback)"""
+    # Clamp to capacity: messages longer than the buffer truncate, as
+    # the original per-element loop did
+    n = min(flat.size, bits.size)
+    # XOR form sets the LSB without a dtype-specific mask constant
+    flat[:n] ^= ((flat[:n] ^ bits[:n]) & 1).astype(flat.dtype)
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def lsb_stats(samples):
+        """Count set LSBs in a 1-D sample array in one parallel reduction"""
+        ones = 0
+        for i in numba.prange(samples.size):
+            ones += samples[i] & 1
+        return ones, samples.size
+
+    @numba.njit(parallel=True, cache=True)
+    def extract_lsb_bytes(arr, num_bytes):
+        """Pack the LSBs of arr into num_bytes bytes in one fused pass"""
+        out = np.empty(num_bytes, np.uint8)
+        for bi in numba.prange(num_bytes):
+            b = 0
+            base = bi * 8
+            for k in range(8):
+                b = (b << 1) | (arr[base + k] & 1)
+            out[bi] = b
+        return out
+
+    @numba.njit(cache=True)
+    def embed_lsb(flat, bits):
+        """Set the LSBs of flat[:len(bits)] to bits, in place"""
+        # Clamp to capacity: njit code is not bounds-checked, so an
+        # unclamped loop would write past the buffer for long messages
+        n = min(flat.size, bits.size)
+        for i in range(n):
+            flat[i] = flat[i] ^ ((flat[i] ^ bits[i]) & 1)
+else:
+    lsb_stats = _lsb_stats_py
+    extract_lsb_bytes = _extract_lsb_bytes_py
+    embed_lsb = _embed_lsb_py
@@ -19,10 +19,18 @@ try:
 except ImportError:
     AudioSegment = None
 
+from ._kernels import lsb_stats
+
 
 class AudioSteganographyAnalyzer:
     """Analyzes audio files for hidden steganographic data"""
-    
+
+    # Hard cap on marker-based LSB extraction (2 KB of payload): a false
+    # byte-aligned end-marker match in random LSBs can sit far into the
+    # channel, and binary_data is serialized one character per bit
+    MAX_EXTRACT_BITS = 16384
+
+
     def __init__(self, audio_path):
         """
         Initialize analyzer with audio path
@@ -36,6 +44,8 @@ class AudioSteganographyAnalyzer:
         self.sample_rate = 0
         self.channels = 0
         self.duration = 0
+        # Reusable contiguous float32 window for FFT-based detection
+        self._fft_buf = np.empty(8192, dtype=np.float32)
         self.load_audio()
     
     def load_audio(self):
@@ -54,11 +64,13 @@ class AudioSteganographyAnalyzer:
             self.channels = self.audio_segment.channels
             self.duration = len(self.audio_segment) / 1000.0  # Convert to seconds
             
-            # Convert to numpy array
-            raw_audio = self.audio_segment.raw_data
-            self.audio_array = np.frombuffer(raw_audio, dtype=np.int16)
-            
-            # If stereo, reshape
+            # Convert to numpy array without copying: get_array_of_samples
+            # exposes the sample buffer directly, unlike raw_data which
+            # materializes a fresh bytes object
+            samples = self.audio_segment.get_array_of_samples()
+            self.audio_array = np.frombuffer(memoryview(samples), dtype=np.int16)
+
+            # If stereo, reshape (a view, no copy)
             if self.channels == 2:
                 self.audio_array = self.audio_array.reshape(-1, 2)
             
@@ -81,22 +93,22 @@ class AudioSteganographyAnalyzer:
         }
         
         try:
-            # Flatten audio array
+            # Flatten audio array (reshape returns a view, no copy)
             if self.channels == 2:
-                samples = self.audio_array.flatten()
+                samples = self.audio_array.reshape(-1)
             else:
                 samples = self.audio_array
             
-            # Analyze LSB patterns
-            lsb_values = samples & 1
-            
+            # Analyze LSB patterns in one fused pass (Numba kernel if available)
+            ones, total = lsb_stats(samples)
+
             # Statistical analysis
-            ones_ratio = np.sum(lsb_values) / len(lsb_values)
+            ones_ratio = ones / total
             deviation = abs(ones_ratio - 0.5)
-            
-            # Chi-square test
-            expected = len(lsb_values) / 2
-            chi_square = np.sum((np.bincount(lsb_values) - expected) ** 2 / expected)
+
+            # Chi-square test (closed form from the two counts)
+            expected = total / 2
+            chi_square = ((ones - expected) ** 2 + (total - ones - expected) ** 2) / expected
             
             # Detection threshold
             if deviation > 0.08 or chi_square > 50:
@@ -119,11 +131,15 @@ class AudioSteganographyAnalyzer:
     def extract_lsb_data(self, num_bits=1000, channel=0):
         """
         Extract data from LSB of audio samples
-        
+
+        Scans the channel for the 16-bit end marker and extracts up to it
+        (capped at MAX_EXTRACT_BITS); falls back to the first num_bits
+        when no marker is present.
+
         Args:
-            num_bits: Number of bits to extract
+            num_bits: Number of bits to extract when no end marker is found
             channel: Audio channel (0=left, 1=right for stereo)
-        
+
         Returns:
             dict: Extracted data
         """
@@ -142,37 +158,50 @@ class AudioSteganographyAnalyzer:
             else:
                 channel_data = self.audio_array
             
-            # Extract LSBs
-            lsb_bits = []
-            bits_extracted = 0
-            
-            for sample in channel_data:
-                if bits_extracted >= num_bits:
-                    break
-                lsb_bits.append(str(sample & 1))
-                bits_extracted += 1
-            
-            binary_string = ''.join(lsb_bits)
+            # Extract LSBs in one vectorized pass
+            bits = (channel_data & 1).astype(np.uint8)
+
+            # Search for the 16-bit end marker on byte boundaries so short
+            # payloads stop early and longer ones aren't truncated
+            marker = np.unpackbits(np.frombuffer(b'\xff\xfe', dtype=np.uint8))
+            marker_pos = -1
+            if bits.size >= marker.size:
+                windows = np.lib.stride_tricks.sliding_window_view(bits, marker.size)
+                matches = np.flatnonzero(np.all(windows[::8] == marker, axis=1))
+                if matches.size:
+                    marker_pos = int(matches[0]) * 8
+
+            truncated = False
+            if marker_pos >= 0:
+                if marker_pos > self.MAX_EXTRACT_BITS:
+                    marker_pos = self.MAX_EXTRACT_BITS
+                    truncated = True
+                bits = bits[:marker_pos]
+            else:
+                bits = bits[:min(num_bits, bits.size)]
+
+            binary_string = ''.join(bits.astype(str))
             results['binary_data'] = binary_string
             results['extracted'] = True
-            
+
             # Try to decode as ASCII
             try:
-                bytes_data = []
-                for i in range(0, len(binary_string), 8):
-                    if i + 8 <= len(binary_string):
-                        byte = binary_string[i:i+8]
-                        bytes_data.append(int(byte, 2))
-                
-                text = ''.join([chr(b) if 32 <= b < 127 else '.' for b in bytes_data])
+                # Pack bits into bytes directly (whole bytes only),
+                # then replace non-printable bytes with '.' in one pass
+                bytes_data = np.packbits(bits[:(bits.size // 8) * 8])
+
+                printable = (bytes_data >= 32) & (bytes_data < 127)
+                text = np.where(printable, bytes_data, ord('.')).astype(np.uint8).tobytes().decode('ascii')
                 results['data'] = text
             except:
                 results['data'] = "Binary data (not ASCII)"
-            
+
             results['details'] = {
-                'bits_extracted': len(lsb_bits),
-                'bytes_extracted': len(binary_string) // 8,
-                'channel_used': channel
+                'bits_extracted': int(bits.size),
+                'bytes_extracted': int(bits.size // 8),
+                'channel_used': channel,
+                'end_marker_found': marker_pos >= 0,
+                'truncated': truncated
             }
             
         except Exception as e:
@@ -201,8 +230,14 @@ class AudioSteganographyAnalyzer:
             else:
                 samples = self.audio_array
             
-            # FFT to analyze phase
-            fft_result = np.fft.fft(samples[:8192])  # Analyze first 8192 samples
+            # Real FFT to analyze phase: the signal is real, so the full
+            # complex FFT would just mirror the spectrum at double the cost.
+            # Copy the window into the preallocated contiguous float32
+            # buffer so pocketfft doesn't cast int16 input internally.
+            n = min(8192, samples.size)
+            sig = self._fft_buf[:n]
+            np.copyto(sig, samples[:n])
+            fft_result = np.fft.rfft(sig)
             phase = np.angle(fft_result)
             
             # Check for unusual phase patterns
@@ -216,7 +251,7 @@ class AudioSteganographyAnalyzer:
             
             results['details'] = {
                 'phase_std': float(phase_std),
-                'samples_analyzed': min(8192, len(samples))
+                'samples_analyzed': n
             }
             
         except Exception as e:
@@ -6,8 +6,30 @@ Detects and extracts hidden data from video files by analyzing frames
 import cv2
 import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
 from .image_analyzer import ImageSteganographyAnalyzer
-import tempfile
+
+
+def _analyze_frame(frame, idx):
+    """
+    Analyze a single frame (top-level so it pickles for process pools)
+
+    Frames arrive in OpenCV's BGR order; the detection statistics don't
+    depend on channel order, so no conversion is needed.
+    """
+    try:
+        frame_analyzer = ImageSteganographyAnalyzer.from_array(frame)
+        frame_analysis = frame_analyzer.analyze()
+        return {
+            'frame_number': idx,
+            'lsb_detected': frame_analysis['lsb_detection']['detected'],
+            'lsb_confidence': frame_analysis['lsb_detection']['confidence']
+        }
+    except Exception as e:
+        return {
+            'frame_number': idx,
+            'error': str(e)
+        }
 
 
 class VideoSteganographyAnalyzer:
@@ -21,25 +43,27 @@ class VideoSteganographyAnalyzer:
             video_path: Path to the video file
         """
         self.video_path = video_path
-        self.cap = None
         self.fps = 0
         self.frame_count = 0
         self.width = 0
         self.height = 0
-        self.load_video()
-    
-    def load_video(self):
-        """Load video file and get metadata"""
+        self._read_metadata()
+
+    def _read_metadata(self):
+        """Read video metadata with a short-lived capture"""
         try:
-            self.cap = cv2.VideoCapture(self.video_path)
-            if not self.cap.isOpened():
-                raise Exception("Could not open video file")
-            
-            self.fps = self.cap.get(cv2.CAP_PROP_FPS)
-            self.frame_count = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            
+            cap = cv2.VideoCapture(self.video_path)
+            try:
+                if not cap.isOpened():
+                    raise Exception("Could not open video file")
+
+                self.fps = cap.get(cv2.CAP_PROP_FPS)
+                self.frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                self.width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                self.height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            finally:
+                cap.release()
+
             return True
         except Exception as e:
             raise Exception(f"Error loading video: {str(e)}")
@@ -50,25 +74,41 @@ class VideoSteganographyAnalyzer:
         
         Args:
             num_frames: Number of frames to extract
-        
+
         Returns:
-            list: Array of frame arrays
+            list: Array of frame arrays (BGR, as decoded by OpenCV)
         """
         frames = []
         frame_interval = max(1, self.frame_count // num_frames)
-        
-        for i in range(0, self.frame_count, frame_interval):
-            if len(frames) >= num_frames:
-                break
-            
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-            ret, frame = self.cap.read()
-            
-            if ret:
-                # Convert BGR to RGB
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frames.append(frame_rgb)
-        
+
+        # The capture is opened only for the duration of the read, so
+        # analyzers that just report video_info never hold a decoder or
+        # file descriptor open
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            if not cap.isOpened():
+                return frames
+
+            # Read the stream sequentially: CAP_PROP_POS_FRAMES seeks force
+            # a keyframe rescan per seek on most codecs, and grab() skips
+            # the decode entirely for frames we don't keep
+            idx = 0
+            while len(frames) < num_frames:
+                if idx % frame_interval == 0:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    # Keep the decoded BGR frame as-is: the LSB/DCT
+                    # statistics are channel-order agnostic, so converting
+                    # to RGB here would just copy 3*W*H bytes per frame
+                    frames.append(frame)
+                else:
+                    if not cap.grab():
+                        break
+                idx += 1
+        finally:
+            cap.release()
+
         return frames
     
     def analyze_frames(self, frames):
@@ -91,43 +131,19 @@ class VideoSteganographyAnalyzer:
         
         detections = []
         confidences = []
-        
-        # Analyze each frame
-        for idx, frame in enumerate(frames):
-            # Save frame temporarily
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-                cv2.imwrite(tmp_path, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-            
-            try:
-                # Use image analyzer on frame
-                frame_analyzer = ImageSteganographyAnalyzer(tmp_path)
-                frame_analysis = frame_analyzer.analyze()
-                
-                frame_result = {
-                    'frame_number': idx,
-                    'lsb_detected': frame_analysis['lsb_detection']['detected'],
-                    'lsb_confidence': frame_analysis['lsb_detection']['confidence']
-                }
-                
-                results['frame_results'].append(frame_result)
-                
-                if frame_analysis['lsb_detection']['detected']:
-                    detections.append(True)
-                    confidences.append(frame_analysis['lsb_detection']['confidence'])
-                
-            except Exception as e:
-                frame_result = {
-                    'frame_number': idx,
-                    'error': str(e)
-                }
-                results['frame_results'].append(frame_result)
-            finally:
-                # Clean up temp file
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+
+        # Analyze frames in parallel: each one is independent and CPU-bound
+        if frames:
+            max_workers = min(len(frames), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results['frame_results'] = list(
+                    executor.map(_analyze_frame, frames, range(len(frames)))
+                )
+
+        for frame_result in results['frame_results']:
+            if frame_result.get('lsb_detected'):
+                detections.append(True)
+                confidences.append(frame_result['lsb_confidence'])
         
         # Overall detection
         if detections:
@@ -175,9 +191,4 @@ class VideoSteganographyAnalyzer:
         analysis['frame_analysis'] = self.analyze_frames(frames)
         
         return analysis
-    
-    def __del__(self):
-        """Clean up video capture"""
-        if self.cap:
-            self.cap.release()
 
@@ -0,0 +1,15 @@
+"""
+WSGI entry point for production deployment
+
+Run with a single threaded worker: the task queue, analysis cache and
+session history in app.py are process-local, so multiple web workers
+would not see each other's tasks. CPU-heavy analysis already runs in a
+shared process pool, so the web worker only needs threads for I/O:
+
+    gunicorn -w 1 -k gthread --threads 8 --timeout 300 wsgi:app
+"""
+
+from app import app
+
+if __name__ == '__main__':
+    app.run()